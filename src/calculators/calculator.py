@@ -1,50 +1,86 @@
 """
 calculators.py
 
-Defines an abstract base class for calculating ingredient weights in a pizza dough recipe.
+Defines the shared ingredient-weight functions and an abstract base class for pizza dough calculators.
 """
 
 from abc import ABC, abstractmethod
 from src.recipe import PizzaRecipe
 
+_PERCENT = 0.01
 
-class PizzaCalculator(ABC):
-    """
-    Abstract base class for calculating ingredient weights based on a PizzaRecipe.
 
-    Subclasses must implement `calculate_yeast_percentage` to define specific yeast logic.
+def _flour_weight(number_of_balls: float, ball_weight: float, hydration: float,
+                  oil_percentage: float, salt_percentage: float) -> float:
+    """Returns the flour weight for the given dough weight and baker's percentages."""
+    return (number_of_balls * ball_weight) / (1 + (hydration + oil_percentage + salt_percentage) * _PERCENT)
+
+
+def _ingredient_weight(flour_weight: float, percentage: float) -> float:
+    """Returns the weight of an ingredient given the flour weight and its baker's percentage."""
+    return flour_weight * percentage * _PERCENT
+
+
+def calculate_flour_weight(recipe: 'PizzaRecipe') -> float:
+    """Calculates the flour weight based on the total dough weight and hydration percentages."""
+    return _flour_weight(recipe.number_of_balls, recipe.ball_weight,
+                         recipe.hydration, recipe.oil_percentage, recipe.salt_percentage)
+
+
+def calculate_water_weight(recipe: 'PizzaRecipe') -> float:
+    """Returns the water weight based on hydration percentage."""
+    return _ingredient_weight(recipe.flour_weight, recipe.hydration)
+
+
+def calculate_oil_weight(recipe: 'PizzaRecipe') -> float:
+    """Returns the oil weight based on oil percentage."""
+    return _ingredient_weight(recipe.flour_weight, recipe.oil_percentage)
+
+
+def calculate_salt_weight(recipe: 'PizzaRecipe') -> float:
+    """Returns the salt weight based on salt percentage."""
+    return _ingredient_weight(recipe.flour_weight, recipe.salt_percentage)
+
+
+def calculate_yeast_weight(recipe: 'PizzaRecipe') -> float:
+    """Returns the yeast weight based on yeast percentage."""
+    return _ingredient_weight(recipe.flour_weight, recipe.yeast_percentage)
+
+
+def calculate_all(recipe: 'PizzaRecipe') -> tuple[float, float, float, float, float]:
     """
+    Returns all ingredient weights in a single pass.
 
-    @staticmethod
-    def calculate_flour_weight(recipe: 'PizzaRecipe') -> float:
-        """Calculates the flour weight based on the total dough weight and hydration percentages."""
-        total_percentage = 1 + ((recipe.hydration + recipe.oil_percentage + recipe.salt_percentage) / 100)
-        return (recipe.number_of_balls * recipe.ball_weight) / total_percentage
+    Args:
+        recipe (PizzaRecipe): The pizza recipe instance.
 
-    @staticmethod
-    def _calculate_ingredient_weight(recipe: 'PizzaRecipe', percentage: float) -> float:
-        """Returns the weight of an ingredient given its percentage and flour weight."""
-        return recipe.flour_weight * percentage / 100
+    Returns:
+        tuple[float, float, float, float, float]: Flour, water, salt, oil and yeast weights.
+    """
+    flour_weight = recipe.flour_weight
+    scale = flour_weight * _PERCENT
+    return (flour_weight,
+            scale * recipe.hydration,
+            scale * recipe.salt_percentage,
+            scale * recipe.oil_percentage,
+            scale * recipe.yeast_percentage)
 
-    @staticmethod
-    def calculate_water_weight(recipe: 'PizzaRecipe') -> float:
-        """Returns the water weight based on hydration percentage."""
-        return PizzaCalculator._calculate_ingredient_weight(recipe, recipe.hydration)
 
-    @staticmethod
-    def calculate_oil_weight(recipe: 'PizzaRecipe') -> float:
-        """Returns the oil weight based on oil percentage."""
-        return PizzaCalculator._calculate_ingredient_weight(recipe, recipe.oil_percentage)
+class PizzaCalculator(ABC):
+    """
+    Abstract base class for calculating ingredient weights based on a PizzaRecipe.
 
-    @staticmethod
-    def calculate_salt_weight(recipe: 'PizzaRecipe') -> float:
-        """Returns the salt weight based on salt percentage."""
-        return PizzaCalculator._calculate_ingredient_weight(recipe, recipe.salt_percentage)
+    The weight calculations are shared module-level functions, exposed here so a recipe
+    can reach them through its calculator instance.
+    Subclasses must implement `calculate_yeast_percentage` to define specific yeast logic.
+    """
 
-    @staticmethod
-    def calculate_yeast_weight(recipe: 'PizzaRecipe') -> float:
-        """Returns the yeast weight based on yeast percentage."""
-        return PizzaCalculator._calculate_ingredient_weight(recipe, recipe.yeast_percentage)
+    calculate_flour_weight = staticmethod(calculate_flour_weight)
+    calculate_water_weight = staticmethod(calculate_water_weight)
+    calculate_oil_weight = staticmethod(calculate_oil_weight)
+    calculate_salt_weight = staticmethod(calculate_salt_weight)
+    calculate_yeast_weight = staticmethod(calculate_yeast_weight)
+    calculate_all = staticmethod(calculate_all)
 
     @staticmethod
     @abstractmethod
@@ -5,11 +5,17 @@ Implements NeapolitanCalculator, a subclass of PizzaCalculator,
 specialized for Neapolitan-style dough using config-based yeast percentage lookup.
 """
 
+from functools import lru_cache
+from math import isnan
+
 from src.recipe import PizzaRecipe
-from src.data import DataExtractor
+from src.data import DataExtractor, get_data_extractor
 from src.errors import ErrorMessages
 from .calculator import PizzaCalculator
 
+_ROOM_MISMATCH = ErrorMessages.MISMATCH_FERMENTATION.format("Room")
+_FRIDGE_MISMATCH = ErrorMessages.MISMATCH_FERMENTATION.format("Fridge")
+
 
 class NeapolitanCalculator(PizzaCalculator):
     """
@@ -21,60 +27,101 @@ class NeapolitanCalculator(PizzaCalculator):
     @staticmethod
     def calculate_yeast_percentage(recipe: 'PizzaRecipe') -> float:
         """Calculate yeast percentage based on fermentation time and temperature."""
-        data_extractor = DataExtractor()
+        return NeapolitanCalculator._lookup_yeast_percentage(
+            recipe.yeast_type,
+            recipe.room_fermentation,
+            recipe.room_temperature,
+            recipe.fridge_fermentation,
+            recipe.fridge_temperature)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _lookup_yeast_percentage(yeast_type: str,
+                                 room_fermentation: float,
+                                 room_temperature: float,
+                                 fridge_fermentation: float,
+                                 fridge_temperature: float) -> float:
+        """
+        Looks up the yeast percentage for a set of fermentation parameters.
+
+        The yeast table is static, so results are memoized per parameter combination.
+        Call `cache_clear()` on this function if the table is reloaded.
+
+        Returns:
+            float: The yeast percentage from the yeast table.
+        """
+        data_extractor = get_data_extractor()
         _get_duration_column = data_extractor.get_closest_duration_column
 
-        NeapolitanCalculator._validate_fermentation_conditions(recipe)
+        fermentation_state = (room_fermentation != 0, fridge_fermentation != 0)
+        has_room_fermentation, has_fridge_fermentation = fermentation_state
+
+        NeapolitanCalculator._validate_fermentation_conditions(fermentation_state, room_temperature, fridge_temperature)
 
-        if recipe.room_fermentation == 0:
-            duration_column = _get_duration_column(recipe.fridge_fermentation, recipe.fridge_temperature)
-        elif recipe.fridge_fermentation == 0:
-            duration_column = _get_duration_column(recipe.room_fermentation, recipe.room_temperature)
+        if not has_room_fermentation:
+            duration_column = _get_duration_column(fridge_fermentation, fridge_temperature)
+        elif not has_fridge_fermentation:
+            duration_column = _get_duration_column(room_fermentation, room_temperature)
         else:
-            duration_column = NeapolitanCalculator._get_combined_duration_column(recipe, data_extractor)
+            duration_column = NeapolitanCalculator._get_combined_duration_column(
+                room_fermentation, room_temperature, fridge_fermentation, fridge_temperature, data_extractor)
 
-        return data_extractor.get_yeast_percentage(recipe.yeast_type, duration_column)
+        return data_extractor.get_yeast_percentage(yeast_type, duration_column)
 
     @staticmethod
-    def _validate_fermentation_conditions(recipe: 'PizzaRecipe'):
+    def _validate_fermentation_conditions(fermentation_state: tuple[bool, bool],
+                                          room_temperature: float,
+                                          fridge_temperature: float):
         """
         Validates that fermentation durations are consistent with specified temperatures.
 
+        Args:
+            fermentation_state (tuple[bool, bool]): Whether room and fridge fermentation durations are set.
+            room_temperature (float): Room fermentation temperature.
+            fridge_temperature (float): Fridge fermentation temperature.
+
         Raises:
             ValueError: If fermentation duration is set but temperature is missing.
         """
-        if recipe.room_temperature == 0 and recipe.room_fermentation != 0:
-            raise ValueError(ErrorMessages.MISMATCH_FERMENTATION.format("Room"))
-        elif recipe.fridge_temperature == 0 and recipe.fridge_fermentation != 0:
-            raise ValueError(ErrorMessages.MISMATCH_FERMENTATION.format("Fridge"))
-        elif recipe.room_temperature == 0 and recipe.fridge_temperature == 0:
+        has_room_fermentation, has_fridge_fermentation = fermentation_state
+
+        if room_temperature == 0 and has_room_fermentation:
+            raise ValueError(_ROOM_MISMATCH)
+        elif fridge_temperature == 0 and has_fridge_fermentation:
+            raise ValueError(_FRIDGE_MISMATCH)
+        elif room_temperature == 0 and fridge_temperature == 0:
             raise ValueError(ErrorMessages.MISSING_TEMPERATURES)
 
     @staticmethod
-    def _get_combined_duration_column(recipe: 'PizzaRecipe', data_extractor: 'DataExtractor') -> int:
+    def _get_combined_duration_column(room_fermentation: float,
+                                      room_temperature: float,
+                                      fridge_fermentation: float,
+                                      fridge_temperature: float,
+                                      data_extractor: 'DataExtractor') -> int:
         """
         Combines room and fridge fermentation durations to compute an effective column index.
 
         Args:
-            recipe (PizzaRecipe): The recipe containing fermentation data.
+            room_fermentation (float): Room fermentation duration in hours.
+            room_temperature (float): Room fermentation temperature.
+            fridge_fermentation (float): Fridge fermentation duration in hours.
+            fridge_temperature (float): Fridge fermentation temperature.
             data_extractor (DataExtractor): Helper to extract yeast percentage data.
 
         Returns:
             int: Index of the column corresponding to the combined fermentation duration.
 
         Raises:
-            ValueError: If the intermediate data is invalid or cannot be converted.
+            ValueError: If the yeast table has no value for the room duration at the fridge temperature.
         """
         _get_duration_column = data_extractor.get_closest_duration_column
 
-        room_duration_column = _get_duration_column(recipe.room_fermentation, recipe.room_temperature)
-        temperature_row_index = data_extractor.get_temperature_row_index(recipe.fridge_temperature, strict=False)
-        room_fermentation_value_at_fridge = data_extractor.get_cell_value(temperature_row_index, room_duration_column)
+        room_duration_column = _get_duration_column(room_fermentation, room_temperature)
+        room_fermentation_value_at_fridge = data_extractor.get_cell_value_by_temperature(
+            fridge_temperature, room_duration_column)
 
-        try:
-            room_fermentation_value_at_fridge = float(room_fermentation_value_at_fridge)
-        except ValueError:
+        if isnan(room_fermentation_value_at_fridge):
             raise ValueError(ErrorMessages.INVALID_FERMENTATION)
 
-        combined_fermentation_duration = room_fermentation_value_at_fridge + recipe.fridge_fermentation
-        return _get_duration_column(combined_fermentation_duration, recipe.fridge_temperature)
+        combined_fermentation_duration = room_fermentation_value_at_fridge + fridge_fermentation
+        return _get_duration_column(combined_fermentation_duration, fridge_temperature)
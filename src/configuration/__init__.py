@@ -9,4 +9,4 @@ Data:
 - ui_config.json: UI layout and behavior settings.
 """
 
-from .configuration import Configuration
+from .configuration import Configuration, get_configuration
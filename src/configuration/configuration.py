@@ -1,47 +1,107 @@
 """
 configuration.py
 
-Singleton Configuration class for loading and managing settings from JSON files.
+Configuration class for lazily loading and managing settings from JSON files.
 Provides centralized access to yeast parameters, UI layout, fonts, icons, and viewport settings.
 """
 
 import json
+from functools import cache, cached_property
 from pathlib import Path
 
 
 class Configuration:
     """Loads and exposes config data for recipe logic and UI layout."""
 
-    _instance = None
     _ROOT = Path(__file__).resolve()
     _ASSETS_ROOT = _ROOT.parents[2] / "assets"
     _RELATIVE_ROOT = _ROOT.parents[0]
+    _DATA_ROOT = _ROOT.parents[1] / "data"
     _PIZZA_CONFIGURATION_PATH = rf"neapolitan_config.json"
     _UI_CONFIGURATION_PATH = rf"ui_config.json"
 
-    def __new__(cls):
-        """Ensures that only one instance of Configuration exists (singleton pattern)."""
-        if cls._instance is None:
-            cls._instance = super(Configuration, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        """Initializes configuration data from JSON files if not already initialized."""
-        if self._initialized:
-            return
-
-        self._pizza_data = self._load_config(self._PIZZA_CONFIGURATION_PATH)
-        self._ui_data = self._load_config(self._UI_CONFIGURATION_PATH)
+    @cached_property
+    def _pizza_data(self):
+        """Pizza configuration data, loaded on first access."""
+        return self._load_config(self._PIZZA_CONFIGURATION_PATH)
+
+    @cached_property
+    def _ui_data(self):
+        """UI configuration data, loaded on first access."""
+        return self._load_config(self._UI_CONFIGURATION_PATH)
+
+    @cached_property
+    def _yeast_table_parameters(self):
+        """Yeast table section of the pizza configuration."""
+        return self._pizza_data["yeast_table_parameters"]
+
+    @cached_property
+    def _base_recipe(self):
+        """Base recipe section of the pizza configuration."""
+        return self._pizza_data["base_recipe"]
+
+    @cached_property
+    def _yeast_table_filepath(self):
+        """Full path to the yeast table file."""
+        return self._DATA_ROOT / self.get_yeast_table_filename()
+
+    @cached_property
+    def _fonts_data(self):
+        """Fonts section of the UI configuration."""
+        return self._ui_data["fonts"]
+
+    @cached_property
+    def _icons_data(self):
+        """Icons section of the UI configuration."""
+        return self._ui_data["icons"]
+
+    @cached_property
+    def _viewport_data(self):
+        """Viewport section of the UI configuration."""
+        return self._ui_data["viewport"]
+
+    @cached_property
+    def _font_paths(self):
+        """Font file path and size for each configured font type."""
+        fonts_directory = self._ASSETS_ROOT / self.get_fonts_directory()
+        return {
+            font_type: (fonts_directory / font["filename"], font["size"])
+            for font_type, font in self._fonts_data.items()
+            if isinstance(font, dict)
+        }
+
+    @cached_property
+    def _icon_paths(self):
+        """Full file path for each configured icon type."""
+        icons_directory = self._ASSETS_ROOT / self.get_icons_directory()
+        return {
+            icon_type: str(icons_directory / filename)
+            for icon_type, filename in self._icons_data.items()
+            if icon_type.endswith("_icon")
+        }
+
+    @cached_property
+    def _fonts(self):
+        """Title, default and secondary title fonts."""
+        return self.get_font("title_font"), self.get_font("default_font"), self.get_font("secondary_title_font")
 
-        self._yeast_table_parameters = self._pizza_data["yeast_table_parameters"]
-        self._base_recipe = self._pizza_data["base_recipe"]
+    @cached_property
+    def _application_icons(self):
+        """Small and large application icons."""
+        return self.get_icon("small_icon"), self.get_icon("large_icon")
 
-        self._fonts_data = self._ui_data["fonts"]
-        self._icons_data = self._ui_data["icons"]
-        self._viewport_data = self._ui_data["viewport"]
+    @cached_property
+    def _action_icons(self):
+        """Save, load and export action icons."""
+        return self.get_icon("save_icon"), self.get_icon("load_icon"), self.get_icon("export_icon")
 
-        self._initialized = True
+    @cached_property
+    def _viewport(self):
+        """Application title, width, height and position of the viewport."""
+        return (self.get_application_title(),
+                self.get_viewport_width(),
+                self.get_viewport_height(),
+                self.get_viewport_position())
 
     def _load_config(self, configuration_path):
         """
@@ -57,10 +117,10 @@ class Configuration:
             FileNotFoundError: If the file does not exist.
         """
         path = self._RELATIVE_ROOT / configuration_path
-        if not path.is_file():
-            raise FileNotFoundError(f"Config file not found: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        try:
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
 
     def get_yeast_table_filename(self):
         """Returns the filename of the yeast table."""
@@ -68,7 +128,7 @@ class Configuration:
 
     def get_yeast_table_filepath(self):
         """Returns the full path to the yeast table file."""
-        return Path(__file__).parent.parent / rf"data\{self.get_yeast_table_filename()}"
+        return self._yeast_table_filepath
 
     def get_yeast_types(self):
         """Returns the list of yeast types."""
@@ -122,12 +182,11 @@ class Configuration:
         Returns:
             tuple[Path, int]: Font file path and font size.
         """
-        font = self._fonts_data[font_type]
-        return self._ASSETS_ROOT / self.get_fonts_directory() / font["filename"], font["size"]
+        return self._font_paths[font_type]
 
     def get_fonts(self):
         """Returns a tuple containing all configured fonts."""
-        return self.get_font("title_font"), self.get_font("default_font"), self.get_font("secondary_title_font")
+        return self._fonts
 
     def get_icons_directory(self):
         """Returns the relative path to the icons' directory."""
@@ -143,15 +202,15 @@ class Configuration:
         Returns:
             str: Full file path to the icon.
         """
-        return str(self._ASSETS_ROOT / self.get_icons_directory() / self._icons_data[icon_type])
+        return self._icon_paths[icon_type]
 
     def get_application_icons(self):
         """Returns the small and large application icons."""
-        return self.get_icon("small_icon"), self.get_icon("large_icon")
+        return self._application_icons
 
     def get_action_icons(self):
         """Returns save, load, and export action icons."""
-        return self.get_icon("save_icon"), self.get_icon("load_icon"), self.get_icon("export_icon")
+        return self._action_icons
 
     def get_application_title(self):
         """Returns the application window title."""
@@ -171,11 +230,14 @@ class Configuration:
 
     def get_viewport_data(self):
         """Returns a tuple of application title, width, height, and position."""
-        return (self.get_application_title(),
-                self.get_viewport_width(),
-                self.get_viewport_height(),
-                self.get_viewport_position())
+        return self._viewport
 
     def get_action_buttons_dimensions(self):
         """Returns the dimensions for action/menu buttons."""
         return self._icons_data["menu_button_dimensions"]
+
+
+@cache
+def get_configuration() -> Configuration:
+    """Returns the shared Configuration instance."""
+    return Configuration()
@@ -8,4 +8,4 @@ Data:
 - neapolitan_yeast_table.csv: Lookup table for yeast percentages based on temperature and time.
 """
 
-from .data_extractor import DataExtractor
+from .data_extractor import DataExtractor, get_data_extractor
@@ -1,134 +1,124 @@
 """
 data_extractor.py
 
-Defines the singleton DataExtractor class responsible for parsing and extracting yeast data
+Defines the DataExtractor class responsible for parsing and extracting yeast data
 from a CSV file based on temperature, fermentation duration, and yeast type.
 Used to determine the appropriate yeast percentage for pizza dough recipes.
 """
 
-import csv
+from functools import cache
+from math import isnan
+
+import numpy as np
 
 from src.errors import ErrorMessages
-from src.configuration import Configuration
+from src.configuration import get_configuration
 
 
 class DataExtractor:
     """
-    Singleton class to extract yeast data from a CSV file based on temperature, duration, and yeast type.
-    """
-
-    _instance = None
+    Extracts yeast data from a CSV file based on temperature, duration, and yeast type.
 
-    def __new__(cls):
-        """Ensures that only one instance of DataExtractor exists (singleton pattern)."""
-        if cls._instance is None:
-            cls._instance = super(DataExtractor, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Use `get_data_extractor()` to access the shared instance.
+    """
 
     def __init__(self):
         """Initializes CSV data, temperature and duration ranges from the configuration."""
-        if self._initialized:
-            return
-
-        self._configuration = Configuration()
+        self._configuration = get_configuration()
         self._yeast_data_file = self._configuration.get_yeast_table_filepath()
         self._csv_data = self._load_csv()
         self._temperature_column = self._configuration.get_temperature_column()
         self._duration_column_range = self._configuration.get_duration_column_range()
         self._temperature_range = self._configuration.get_selective_temperature_row_range()
         self._temperature_value_range = self.get_temperature_value_range()
-
-        self._initialized = True
+        self._temperature_indices = {
+            temperature: index for index, temperature in enumerate(self._temperature_value_range.tolist())
+        }
+        self._yeast_type_indices = {
+            yeast_type: index for index, yeast_type in enumerate(self._configuration.get_yeast_types())
+        }
+        self._yeast_matrix = self._csv_data[:len(self._yeast_type_indices)]  # One row per yeast type.
+
+        first_temperature_row = self._temperature_range[0]
+        temperature_rows = range(first_temperature_row, first_temperature_row + len(self._temperature_value_range))
+        self._sorted_durations_by_row = {
+            row_index: [int(duration) for duration in sorted(set(self.get_duration_value_range(row_index)))]
+            for row_index in temperature_rows
+        }
+        self._null_offsets_by_row = {
+            row_index: self._get_null_offset(row_index, self._duration_column_range[0])
+            for row_index in temperature_rows
+        }
 
     def _load_csv(self):
         """
-        Loads and parses the CSV file.
+        Loads and parses the CSV file into a numeric table.
+
+        Text and empty cells (labels, headers, missing durations) are stored as NaN.
 
         Returns:
-            list[list[str]]: 2D list containing CSV rows and columns.
+            np.ndarray: 2D float array containing CSV rows and columns.
         """
-        with open(self._yeast_data_file, newline='', encoding='utf-8') as csvfile:
-            return list(csv.reader(csvfile))
+        return np.genfromtxt(self._yeast_data_file, delimiter=',', dtype=np.float64, encoding='utf-8')
 
-    def get_cell_value(self, row: int, column: int) -> str:
+    def get_cell_value_by_temperature(self, temperature: float, column: int, strict: bool = False) -> float:
         """
-        Retrieves the value at a specific row and column (1-based index).
+        Retrieves the value at a specific column of the row matching the given temperature.
 
         Args:
-            row (int): Row index.
+            temperature (float): Temperature value used to locate the row.
             column (int): Column index.
+            strict (bool): If True, only exact match is accepted. If False, the closest match is allowed.
 
         Returns:
-            str: Value at the given cell.
+            float: Value at the given cell, NaN if the cell is empty.
         """
-        return self._csv_data[row][column]
+        return float(self._csv_data[self.get_temperature_row_index(temperature, strict), column])
 
-    def get_temperature_value_range(self) -> list[float]:
+    def get_temperature_value_range(self) -> np.ndarray:
         """
-        Returns a list of temperature values (as floats) found in the configured row range.
+        Returns the temperature values found in the configured row range.
 
         Returns:
-            list[float]: List of temperature values.
+            np.ndarray: Read-only array of temperature values.
         """
-        column_index = self._temperature_column
         row_start, row_end = self._temperature_range
-        reader = self._csv_data
+        temperatures = self._csv_data[row_start:row_end, self._temperature_column]
+        temperatures = temperatures[~np.isnan(temperatures)]
+        temperatures.flags.writeable = False
+        return temperatures
 
-        return [
-            float(reader[i][column_index].strip())
-            for i in range(row_start, row_end)
-            if i < len(reader) and column_index < len(reader[i]) and reader[i][column_index].strip()
-        ]
-
-    def get_duration_value_range(self, row_index: int) -> list[float]:
+    def get_duration_value_range(self, row_index: int) -> tuple[float, ...]:
         """
-        Returns a list of duration values in a specified row.
+        Returns the duration values in a specified row.
 
         Args:
             row_index (int): Row index (1-based).
 
         Returns:
-            list[float]: List of duration values.
+            tuple[float, ...]: Duration values.
         """
         column_start, column_end = self._duration_column_range
-        reader = self._csv_data
-
-        if row_index >= len(reader):
-            return []
 
-        row = reader[row_index]
-        return [
-            float(row[i].strip())
-            for i in range(column_start, column_end)
-            if i < len(row) and row[i].strip()
-        ]
+        if row_index >= len(self._csv_data):
+            return ()
 
-    def get_duration_range_by_temperature(self, temperature: float) -> list[float]:
-        """
-        Retrieves the list of durations available for a given temperature.
-
-        Args:
-            temperature (float): The temperature value.
+        durations = self._csv_data[row_index, column_start:column_end]
+        return tuple(durations[~np.isnan(durations)].tolist())
 
-        Returns:
-            list[float]: List of duration values for the given temperature.
+    def get_sorted_durations_by_temperature(self, temperature: float) -> list[int]:
         """
-        temperature_row_index = self.get_temperature_row_index(temperature, strict=False)
-        return self.get_duration_value_range(temperature_row_index)
+        Returns a sorted list of unique durations for the closest table temperature.
 
-    def get_sorted_durations_by_temperature(self, temperature: float) -> list[float]:
-        """
-        Returns a sorted list of unique durations for a given temperature.
+        The lists are precomputed per temperature row at initialization.
 
         Args:
             temperature (float): Temperature to retrieve durations for.
 
         Returns:
-            list[float]: Sorted and unique duration values.
+            list[int]: Sorted and unique duration values.
         """
-        return [int(duration) for duration in
-                sorted(set(self.get_duration_range_by_temperature(temperature)))]
+        return self._sorted_durations_by_row[self.get_temperature_row_index(temperature, strict=False)]
 
     def get_temperature_row_index(self, temperature: float, strict: bool = True) -> int:
         """
@@ -144,15 +134,12 @@ class DataExtractor:
         Raises:
             ValueError: If temperature is not found and strict is True.
         """
-        temperature_str = f"{temperature:.1f}"
+        local_index = self._temperature_indices.get(temperature)
 
-        if temperature_str in self._temperature_value_range:
-            local_index = self._temperature_value_range.index(temperature)
-        elif not strict:
-            closest_temp = min(self._temperature_value_range, key=lambda x: abs(x - temperature))
-            local_index = self._temperature_value_range.index(closest_temp)
-        else:
-            raise ValueError(ErrorMessages.TEMPERATURE_NOT_FOUND.format(temperature_str))
+        if local_index is None:
+            if strict:
+                raise ValueError(ErrorMessages.TEMPERATURE_NOT_FOUND.format(f"{temperature:.1f}"))
+            local_index = int(np.argmin(np.abs(self._temperature_value_range - temperature)))
 
         return self._temperature_range[0] + local_index
 
@@ -176,30 +163,27 @@ class DataExtractor:
 
         return closest_duration_column
 
-    def _find_closest_duration_column(self, row: int, duration: float, duration_range: list[float]) -> int:
+    def _find_closest_duration_column(self, row: int, duration: float, duration_range: tuple[float, ...]) -> int:
         """
         Finds the closest duration column for a given duration value in a specific row.
 
         Args:
             row (int): Row index.
             duration (float): Duration value to match.
-            duration_range (list[float]): List of durations from the row.
+            duration_range (tuple[float, ...]): Durations from the row.
 
         Returns:
             int: Column index corresponding to the closest duration.
         """
-        duration_values_floats = [float(d) for d in duration_range]
-        closest_diff = min(abs(val - duration) for val in duration_values_floats)
-        closest_relative_index = [
-                       i for i, val in enumerate(duration_values_floats)
-                       if abs(val - duration) == closest_diff
-                   ][-1]
-        offset_column = self._get_null_offset(row, self._duration_column_range[0])
+        reversed_differences = np.abs(np.asarray(duration_range, dtype=np.float64)[::-1] - duration)
+        closest_relative_index = len(duration_range) - 1 - int(np.argmin(reversed_differences))  # Last match wins.
+        offset_column = self._null_offsets_by_row[row]
         return closest_relative_index + offset_column
 
     def _get_null_offset(self, row_index: int, start_col: int) -> int:
         """
         Finds the first non-null column starting from start_col in the specified row.
+        Offsets of the temperature rows are precomputed at initialization.
 
         Args:
             row_index (int): Row index.
@@ -211,17 +195,14 @@ class DataExtractor:
         Raises:
             IndexError: If the row index is out of bounds.
         """
-        reader = self._csv_data
-
-        if row_index >= len(reader):
+        if row_index >= len(self._csv_data):
             raise IndexError(ErrorMessages.INDEX_OUT_OF_BOUNDS.format(row_index))
 
-        row = reader[row_index]
-        for i in range(start_col, len(row)):
-            if row[i].strip():
-                return i
+        non_null = ~np.isnan(self._csv_data[row_index, start_col:])
+        if not non_null.any():
+            return 0
 
-        return 0
+        return start_col + int(np.argmax(non_null))
 
     def get_yeast_type_index(self, yeast_type):
         """
@@ -236,11 +217,10 @@ class DataExtractor:
         Raises:
             ValueError: If the yeast type is not found.
         """
-        yeast_type_row = self._configuration.get_yeast_types()
         try:
-            return yeast_type_row.index(yeast_type)
-        except ValueError:
-            raise ValueError(ErrorMessages.UNKNOWN_YEAST_TYPE.format(yeast_type, yeast_type_row))
+            return self._yeast_type_indices[yeast_type]
+        except KeyError:
+            raise ValueError(ErrorMessages.UNKNOWN_YEAST_TYPE.format(yeast_type, self._configuration.get_yeast_types()))
 
     def get_yeast_percentage(self, yeast_type, duration_column) -> float:
         """
@@ -252,17 +232,22 @@ class DataExtractor:
 
         Returns:
             float: Yeast percentage value.
+
+        Raises:
+            ValueError: If the table has no value for this yeast type and duration.
         """
-        yeast_type_row = self.get_yeast_type_index(yeast_type)
-        return float(self.get_cell_value(yeast_type_row, duration_column))
+        yeast_percentage = float(self._yeast_matrix[self.get_yeast_type_index(yeast_type), duration_column])
+        if isnan(yeast_percentage):
+            raise ValueError(ErrorMessages.UNSUPPORTED_YEAST_DURATION.format(yeast_type, duration_column))
+        return yeast_percentage
 
     @property
-    def temperature_value_range(self) -> list[float]:
+    def temperature_value_range(self) -> np.ndarray:
         """
-        Property for accessing the cached list of temperature values.
+        Property for accessing the cached temperature values.
 
         Returns:
-            list[float]: List of temperature values.
+            np.ndarray: Read-only array of temperature values.
         """
         return self._temperature_value_range
 
@@ -274,3 +259,9 @@ class DataExtractor:
             list[str]: List of yeast types.
         """
         return self._configuration.get_yeast_types()
+
+
+@cache
+def get_data_extractor() -> DataExtractor:
+    """Returns the shared DataExtractor instance."""
+    return DataExtractor()
@@ -20,5 +20,6 @@ class ErrorMessages:
     MISMATCH_FERMENTATION = "Invalid configuration: {} fermentation is not 0"
     INDEX_OUT_OF_BOUNDS = "Index {} is out of bounds for the given data range."
     TEMPERATURE_NOT_FOUND = "Temperature {} not found in temperature value range."
+    UNSUPPORTED_YEAST_DURATION = "No yeast percentage for '{}' at duration column {}: the duration is too short or unsupported."
     UNKNOWN_YEAST_TYPE = "Yeast type '{}' not found in configuration yeast types: {}"
     MISSING_TEMPERATURES = "Missing temperature values: at least one temperature must be set for fermentation."
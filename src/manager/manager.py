@@ -7,15 +7,21 @@ This module manages the saving, loading, and construction of pizza recipes in va
 
 import json
 import os
+import secrets
+import time
 
 from datetime import datetime
-from tkinter import filedialog, messagebox
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 
 from src.recipe import PizzaRecipe
 from src.errors import ErrorMessages
-from src.configuration import Configuration
+from src.configuration import get_configuration
 from src.calculators import NeapolitanCalculator
 
+_get_saved_recipe_values = attrgetter(*PizzaRecipe.FIELDS)
+
 
 class RecipeManager:
     """
@@ -23,11 +29,16 @@ class RecipeManager:
     Supports interaction with GUI dialogs and calculator selection by pizza style.
     """
 
+    _CALCULATORS = {
+        "Neo-Neapolitan": NeapolitanCalculator,
+    }
+
     @staticmethod
     def select_saving_path(file_extension):
         """
         Opens a dialog for the user to select a folder to save a file.
         Ensures a unique filename based on the current date.
+        The file is not created; use `open_saving_file` to also reserve the name.
 
         Args:
             file_extension (str): The desired file extension (e.g., ".json", ".txt").
@@ -35,22 +46,76 @@ class RecipeManager:
         Returns:
             tuple: A tuple (file_path, base_filename) or (None, None) if canceled.
         """
+        folder_path, base_filename = RecipeManager._select_saving_folder(file_extension)
+        if folder_path is None:
+            return None, None
+
+        file_paths = RecipeManager._candidate_file_paths(folder_path, base_filename, file_extension)
+        return next(path for path in file_paths if not os.path.exists(path)), base_filename
+
+    @staticmethod
+    def open_saving_file(file_extension):
+        """
+        Opens a dialog for the user to select a folder and creates a new file in it.
+        The filename is chosen like in `select_saving_path`, but the file is created exclusively,
+        so an existing file is never overwritten.
+
+        Args:
+            file_extension (str): The desired file extension (e.g., ".json", ".txt").
+
+        Returns:
+            tuple: A tuple (file, base_filename) with the file open for writing, or (None, None) if canceled.
+        """
+        folder_path, base_filename = RecipeManager._select_saving_folder(file_extension)
+        if folder_path is None:
+            return None, None
+
+        for file_path in RecipeManager._candidate_file_paths(folder_path, base_filename, file_extension):
+            try:
+                return open(file_path, "x", encoding="utf-8"), base_filename
+            except FileExistsError:
+                continue
+
+    @staticmethod
+    def _select_saving_folder(file_extension):
+        """
+        Opens a dialog for the user to select a folder, creating it if needed.
+
+        Args:
+            file_extension (str): The extension of the file to be saved, shown in the dialog title.
+
+        Returns:
+            tuple: A tuple (folder_path, base_filename) or (None, None) if canceled.
+        """
+        from tkinter import filedialog, messagebox  # Deferred: Tk is only needed once a dialog is shown.
+
         folder_path = filedialog.askdirectory(title=f"Choose Folder to Save Recipe output {file_extension}")
         if not folder_path:
             messagebox.showinfo("No Folder Selected", "No folder was selected.")
             return None, None
 
         os.makedirs(folder_path, exist_ok=True)
+        return folder_path, datetime.now().strftime("%Y-%m-%d")
 
-        base_filename = datetime.now().strftime("%Y-%m-%d")
-        file_path = os.path.join(folder_path, f"{base_filename}{file_extension}")
+    @staticmethod
+    def _candidate_file_paths(folder_path, base_filename, file_extension):
+        """
+        Yields file paths to try for a new file, in order.
+        The plain date name comes first. If that name is taken, a nanosecond timestamp
+        (or, should that collide too, a random token) is appended instead of probing numbered names.
+
+        Args:
+            folder_path (str): The folder to save into.
+            base_filename (str): The date-based base name.
+            file_extension (str): The desired file extension.
 
-        counter = 1
-        while os.path.exists(file_path):
-            file_path = os.path.join(folder_path, f"{base_filename}_{counter}{file_extension}")
-            counter += 1
+        Yields:
+            str: A candidate file path.
+        """
+        suffixes = chain(("", f"_{time.time_ns()}"), iter(lambda: f"_{secrets.token_hex(4)}", None))
 
-        return file_path, base_filename
+        for suffix in suffixes:
+            yield os.path.join(folder_path, f"{base_filename}{suffix}{file_extension}")
 
     @staticmethod
     def save_recipe_as_txt(recipe):
@@ -60,13 +125,12 @@ class RecipeManager:
         Args:
             recipe (PizzaRecipe): The pizza recipe instance to save.
         """
-        file_path, _ = RecipeManager.select_saving_path(".txt")
+        file, _ = RecipeManager.open_saving_file(".txt")
 
-        if file_path is None:
+        if file is None:
             return None
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(str(recipe))
+        RecipeManager._write_new_file(file, lambda f: f.write(str(recipe)))
 
     @staticmethod
     def save_recipe_as_json(recipe):
@@ -76,31 +140,54 @@ class RecipeManager:
         Args:
             recipe (PizzaRecipe): The pizza recipe instance to save.
         """
-        file_path, base_filename = RecipeManager.select_saving_path(".json")
+        file, base_filename = RecipeManager.open_saving_file(".json")
 
-        if file_path is None:
+        if file is None:
             return None
 
-        data = {
-            "info": f"{base_filename}",
-            "base_recipe": {
-                "pizza_style": "Neo-Neapolitan",
-                "salt_percentage": recipe.salt_percentage,
-                "oil_percentage": recipe.oil_percentage,
-                "yeast_type": recipe.yeast_type,
-                "hydration": recipe.hydration,
-                "ball_weight": recipe.ball_weight,
-                "number_of_balls": recipe.number_of_balls,
-                "room_temperature": recipe.room_temperature,
-                "room_fermentation": int(recipe.room_fermentation),
-                "fridge_temperature": recipe.fridge_temperature,
-                "fridge_fermentation": int(recipe.fridge_fermentation),
+        def write_content(f):
+            data = {
+                "info": f"{base_filename}",
+                "base_recipe": RecipeManager._recipe_to_dict(recipe)
             }
-        }
-
-        with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4)
 
+        RecipeManager._write_new_file(file, write_content)
+
+    @staticmethod
+    def _write_new_file(file, write_content):
+        """
+        Writes content into a file just created by `open_saving_file` and closes it.
+        If writing fails, the file is removed so no empty or partial file keeps the name.
+
+        Args:
+            file (TextIO): The newly created file, open for writing.
+            write_content (Callable[[TextIO], None]): Writes the content into the file.
+        """
+        try:
+            with file as f:
+                write_content(f)
+        except Exception:
+            os.remove(file.name)
+            raise
+
+    @staticmethod
+    def _recipe_to_dict(recipe):
+        """
+        Builds the saved "base_recipe" dictionary for a recipe.
+
+        Args:
+            recipe (PizzaRecipe): The pizza recipe instance to convert.
+
+        Returns:
+            dict: The recipe parameters, in the same layout `to_recipe` reads.
+        """
+        base_recipe = {"pizza_style": "Neo-Neapolitan"}
+        base_recipe.update(zip(PizzaRecipe.FIELDS, _get_saved_recipe_values(recipe)))
+        base_recipe["room_fermentation"] = int(base_recipe["room_fermentation"])
+        base_recipe["fridge_fermentation"] = int(base_recipe["fridge_fermentation"])
+        return base_recipe
+
     @staticmethod
     def load_recipe(use_default=False):
         """
@@ -124,7 +211,7 @@ class RecipeManager:
         Returns:
             PizzaRecipe: A recipe created from the default configuration.
         """
-        configuration_file = Configuration()
+        configuration_file = get_configuration()
         default_recipe = configuration_file.get_base_recipe()
         return RecipeManager.to_recipe(default_recipe)
 
@@ -136,6 +223,8 @@ class RecipeManager:
         Returns:
             PizzaRecipe or None: The loaded PizzaRecipe or None if cancelled or invalid.
         """
+        from tkinter import filedialog, messagebox  # Deferred: Tk is only needed once a dialog is shown.
+
         recipe_path = filedialog.askopenfilename(
             title="Select Recipe File",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
@@ -168,15 +257,25 @@ class RecipeManager:
         Raises:
             ValueError: If no matching calculator is found.
         """
-        calculators = {
-            "Neo-Neapolitan": NeapolitanCalculator,
-        }
-
-        calculator_class = calculators.get(pizza_style)
-        if not calculator_class:
+        if pizza_style not in RecipeManager._CALCULATORS:
             raise ValueError(ErrorMessages.NO_CALCULATOR_FOUND.format(pizza_style))
 
-        return calculator_class()
+        return RecipeManager._get_calculator_instance(pizza_style)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_calculator_instance(pizza_style):
+        """
+        Returns the shared calculator instance for a supported pizza style.
+        Calculators hold no state, so one instance per style is reused across recipes.
+
+        Args:
+            pizza_style (str): The name of a pizza style present in `_CALCULATORS`.
+
+        Returns:
+            BaseCalculator: The calculator instance for the specified style.
+        """
+        return RecipeManager._CALCULATORS[pizza_style]()
 
     @staticmethod
     def to_recipe(base_recipe):
@@ -5,12 +5,39 @@ This file contains the PizzaRecipe class, which manages the pizza recipe calcula
 and properties such as flour weight, yeast percentage, and fermentation details.
 """
 
+from contextlib import contextmanager
+
 from .utilities import auto_property
 
 
 class PizzaRecipe:
     """A class to manage pizza recipe."""
 
+    # Recipe parameters read from a base recipe dictionary, in saved-file order.
+    FIELDS = (
+        "salt_percentage",
+        "oil_percentage",
+        "yeast_type",
+        "hydration",
+        "ball_weight",
+        "number_of_balls",
+        "room_temperature",
+        "room_fermentation",
+        "fridge_temperature",
+        "fridge_fermentation",
+    )
+
+    # Recalculations deferred by `batched_updates`, in the order they are replayed.
+    RECALCULATIONS = ("recalculate_flour_weight", "recalculate_yeast_percentage")
+
+    __slots__ = (
+        "_calculator", *(f"_{field}" for field in FIELDS),
+        "_flour_weight", "_yeast_percentage", "_cached_str", "_batch_depth", "_pending_recalculations"
+    )
+
+    # Backing fields copied by `copy_from`: the parameters, their derived values and the cached text.
+    _RECIPE_STATE = (*(f"_{field}" for field in FIELDS), "_flour_weight", "_yeast_percentage", "_cached_str")
+
     salt_percentage = auto_property("salt_percentage", "recalculate_flour_weight")
     oil_percentage = auto_property("oil_percentage", "recalculate_flour_weight")
     hydration = auto_property("hydration", "recalculate_flour_weight")
@@ -33,19 +60,14 @@ class PizzaRecipe:
         """
         self._calculator = calculator
 
-        self._salt_percentage = base_recipe['salt_percentage']
-        self._oil_percentage = base_recipe['oil_percentage']
-        self._hydration = base_recipe['hydration']
-        self._ball_weight = base_recipe['ball_weight']
-        self._number_of_balls = base_recipe['number_of_balls']
-        self._yeast_type = base_recipe['yeast_type']
-        self._room_temperature = base_recipe['room_temperature']
-        self._fridge_temperature = base_recipe['fridge_temperature']
-        self._room_fermentation = base_recipe['room_fermentation']
-        self._fridge_fermentation = base_recipe['fridge_fermentation']
+        for field in self.FIELDS:  # Set the backing fields directly to skip per-field recalculation.
+            setattr(self, f"_{field}", base_recipe[field])
 
         self._flour_weight = None
         self._yeast_percentage = None
+        self._cached_str = None
+        self._batch_depth = 0
+        self._pending_recalculations = frozenset()
 
         self.recalculate_flour_weight()
         self.recalculate_yeast_percentage()
@@ -54,18 +76,73 @@ class PizzaRecipe:
         """
         Recalculates the flour weight using the provided calculator.
 
-        This method updates the `_flour_weight` attribute.
+        This method updates the `_flour_weight` attribute, or defers the update while inside `batched_updates`.
         """
+        self.invalidate_cached_str()
+
+        if self._batch_depth:
+            self._pending_recalculations |= {"recalculate_flour_weight"}
+            return
+
         self._flour_weight = self._calculator.calculate_flour_weight(self)
 
     def recalculate_yeast_percentage(self):
         """
         Recalculates the yeast percentage using the provided calculator.
 
-        This method updates the `_yeast_percentage` attribute.
+        This method updates the `_yeast_percentage` attribute, or defers the update while inside `batched_updates`.
         """
+        self.invalidate_cached_str()
+
+        if self._batch_depth:
+            self._pending_recalculations |= {"recalculate_yeast_percentage"}
+            return
+
         self._yeast_percentage = self._calculator.calculate_yeast_percentage(self)
 
+    def invalidate_cached_str(self):
+        """
+        Drops the cached string representation of the recipe.
+
+        Recalculations call this automatically; call it directly after writing a backing field
+        (e.g. `_room_fermentation`) without going through its property.
+        """
+        self._cached_str = None
+
+    @contextmanager
+    def batched_updates(self):
+        """
+        Defers recalculations triggered by property changes until the outermost batch exits,
+        so several related fields can be updated with at most one recalculation of each kind.
+        Derived values such as `flour_weight` are stale until then. Batches may be nested.
+
+        Yields:
+            PizzaRecipe: The recipe itself.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth:
+                pending, self._pending_recalculations = self._pending_recalculations, frozenset()
+                for name in self.RECALCULATIONS:
+                    if name in pending:
+                        getattr(self, name)()
+
+    def copy_from(self, other):
+        """
+        Copies the recipe data of another recipe into this one.
+        Derived values are copied rather than recalculated. The calculator and any open
+        `batched_updates` state belong to this recipe and are left untouched.
+
+        Args:
+            other (PizzaRecipe): The recipe to copy from.
+        """
+        for attribute in self._RECIPE_STATE:
+            setattr(self, attribute, getattr(other, attribute))
+
     @property
     def pizza_style_calculator(self):
         """Returns the calculator instance used for the pizza style."""
@@ -81,14 +158,18 @@ class PizzaRecipe:
         """Returns the calculated yeast percentage."""
         return self._yeast_percentage
 
-    def _format_yeast(self):
+    @staticmethod
+    def _format_yeast(yeast_weight):
         """
         Formats the yeast weight to a string with appropriate precision.
 
+        Args:
+            yeast_weight (float): The yeast weight in grams.
+
         Returns:
             str: The formatted yeast weight as a string.
         """
-        formatted = f"{self._calculator.calculate_yeast_weight(self):.3f}".rstrip("0").rstrip(".")
+        formatted = f"{yeast_weight:.3f}".rstrip("0").rstrip(".")
         if "." not in formatted:
             formatted += ".0"
         return formatted
@@ -96,16 +177,22 @@ class PizzaRecipe:
     def __str__(self):
         """
         Returns a string representation of the pizza recipe, including all relevant details.
+        The result is cached until the recipe changes.
 
         Returns:
             str: The string representation of the recipe.
         """
+        if self._cached_str is not None:
+            return self._cached_str
+
+        flour, water, salt, oil, yeast = self._calculator.calculate_all(self)
+
         parts = [
-            f"Flour: {round(self._flour_weight)}g",
-            f"Water: {round(self._calculator.calculate_water_weight(self))}g",
-            f"Salt: {round(self._calculator.calculate_salt_weight(self))}g",
-            f"Oil: {round(self._calculator.calculate_oil_weight(self))}g",
-            f"Yeast: {self._format_yeast()}g of {self._yeast_type}"
+            f"Flour: {round(flour)}g",
+            f"Water: {round(water)}g",
+            f"Salt: {round(salt)}g",
+            f"Oil: {round(oil)}g",
+            f"Yeast: {self._format_yeast(yeast)}g of {self._yeast_type}"
         ]
 
         if self._fridge_fermentation and self._fridge_temperature:
@@ -122,4 +209,5 @@ class PizzaRecipe:
             f"Total: {self._number_of_balls} dough balls, each weighing {self._ball_weight}g"
         )
 
-        return "\n".join(parts)
+        self._cached_str = "\n".join(parts)
+        return self._cached_str
@@ -4,6 +4,8 @@ utilities.py
 This file contains utility methods for the PizzaRecipe class.
 """
 
+from operator import attrgetter, methodcaller
+
 
 def auto_property(attr, recalculate_function_name=None):
     """
@@ -19,15 +21,14 @@ def auto_property(attr, recalculate_function_name=None):
         property: The property with custom getter and setter methods.
     """
     private = f"_{attr}"
-
-    def getter(self):
-        return getattr(self, private)
+    getter = attrgetter(private)
+    recalculate = methodcaller(recalculate_function_name) if recalculate_function_name else None
 
     def setter(self, value):
-        if value != getattr(self, private):
+        if value != getter(self):
             setattr(self, private, value)
 
-            if recalculate_function_name:
-                getattr(self, recalculate_function_name)()
+            if recalculate:
+                recalculate(self)
 
     return property(getter, setter)
@@ -6,12 +6,25 @@ the recipe object accordingly, including saving, loading, and adjusting proofing
 """
 
 import dearpygui.dearpygui as dpg
+import numpy as np
 
-from src.data import DataExtractor
+from operator import attrgetter
+
+from src.data import get_data_extractor
 from src.manager import RecipeManager
 from .proofing_handler import ProofingHandler
 from .ui_enums import ProofingType, ProofingMode, IngredientType
 
+# Ingredient widget tags paired with the getter for the matching recipe attribute.
+_INGREDIENT_ACCESSORS = tuple((ingredient.name, attrgetter(ingredient.name)) for ingredient in IngredientType)
+
+# (ProofingType, show) pairs applied for each proofing mode; hidden types have their values reset.
+_PROOFING_MODE_VISIBILITY = {
+    ProofingMode.dual_proofing_mode: ((ProofingType.room, True), (ProofingType.fridge, True)),
+    ProofingMode.room_proofing_only_mode: ((ProofingType.room, True), (ProofingType.fridge, False)),
+    ProofingMode.cold_proofing_only_mode: ((ProofingType.fridge, True), (ProofingType.room, False)),
+}
+
 
 class CallbackHandler:
     """
@@ -27,15 +40,28 @@ class CallbackHandler:
             recipe (PizzaRecipe): The recipe object to update.
         """
         self._recipe = recipe
-        self._data_extractor = DataExtractor()
+        self._data_extractor = get_data_extractor()
         self._proof_handler = ProofingHandler(self._recipe)
 
-        # Cache values and methods to avoid repeated attribute access.
-        self._temperature_value_range = self._data_extractor.temperature_value_range
-        self._get_sorted_durations_by_temperature = self._data_extractor.get_sorted_durations_by_temperature
+        # Set once the output widget has been created; it lives for the rest of the session.
+        self._output_exists = False
+
+        # Durations offered for each table temperature, as a list for the UI and an array for nearest-value search.
+        self._durations_by_temperature = {}
+        for temperature in self._data_extractor.temperature_value_range.tolist():
+            durations = self._data_extractor.get_sorted_durations_by_temperature(temperature)
+            self._durations_by_temperature[temperature] = durations, np.asarray(durations)
 
     def update_output(self):
-        """Updates the UI output text area with the current string representation of the recipe."""
+        """
+        Updates the UI output text area with the current string representation of the recipe.
+        Does nothing until the output widget exists, so the recipe text is not built during UI setup.
+        """
+        if not self._output_exists:
+            if not dpg.does_item_exist("output_text"):
+                return
+            self._output_exists = True
+
         dpg.set_value("output_text", str(self._recipe))
 
     def general_update(self, app_data, user_data):
@@ -59,7 +85,7 @@ class CallbackHandler:
             proofing_type (ProofingType): ProofingType enum (e.g., room or fridge).
         """
         temperature = float(app_data)
-        fermentation = int(dpg.get_value(proofing_type.value["fermentation"]))
+        fermentation = int(dpg.get_value(proofing_type.value.fermentation))
 
         self._apply_proofing_adjustments(proofing_type, temperature, fermentation)
         self.update_output()
@@ -72,7 +98,7 @@ class CallbackHandler:
             app_data (various): New fermentation value from UI.
             proofing_type (ProofingType): ProofingType enum.
         """
-        setattr(self._recipe, proofing_type.value["fermentation"], float(app_data))
+        setattr(self._recipe, proofing_type.value.fermentation, float(app_data))
         self.update_output()
 
     def save_callback(self):
@@ -90,7 +116,7 @@ class CallbackHandler:
         if new_recipe is None:
             return
 
-        self._recipe.__dict__.update(new_recipe.__dict__)  # Copy data into the current recipe instance.
+        self._recipe.copy_from(new_recipe)  # Copy data into the current recipe instance.
 
         self._update_ui_ingredient_elements()
         self._update_proofing_inputs()
@@ -98,17 +124,18 @@ class CallbackHandler:
 
     def _update_ui_ingredient_elements(self):
         """Update ingredient UI elements"""
-        for ingredient in IngredientType:
-            dpg.set_value(ingredient.name, getattr(self._recipe, ingredient.name))
+        for tag, get_ingredient in _INGREDIENT_ACCESSORS:
+            dpg.set_value(tag, get_ingredient(self._recipe))
 
     def _update_proofing_inputs(self):
         """Update temperature/fermentation inputs."""
-        for proofing_type in ProofingType:
-            temperature = getattr(self._recipe, proofing_type.value["temperature"])
-            fermentation = getattr(self._recipe, proofing_type.value["fermentation"])
+        with self._recipe.batched_updates():
+            for proofing_type in ProofingType:
+                temperature = getattr(self._recipe, proofing_type.value.temperature)
+                fermentation = getattr(self._recipe, proofing_type.value.fermentation)
 
-            if temperature != 0 and fermentation != 0:
-                self._apply_proofing_adjustments(proofing_type, temperature, fermentation)
+                if temperature != 0 and fermentation != 0:
+                    self._apply_proofing_adjustments(proofing_type, temperature, fermentation)
 
         self.proofing_mode_setup_callback()
 
@@ -122,32 +149,19 @@ class CallbackHandler:
             temperature (float): User-provided temperature input.
             fermentation (int): User-provided fermentation duration.
         """
-        temperature_tag = proofing_type.value["temperature"]
-        fermentation_tag = proofing_type.value["fermentation"]
+        temperature_tag = proofing_type.value.temperature
+        fermentation_tag = proofing_type.value.fermentation
 
-        selected_temperature = float(min(self._temperature_value_range, key=lambda x: abs(x - temperature)))
-        durations = self._get_sorted_durations_by_temperature(selected_temperature)
-        default_value = int(min(durations, key=lambda x: abs(x - fermentation)))
+        temperatures = self._data_extractor.temperature_value_range
+        selected_temperature = float(temperatures[np.abs(temperatures - temperature).argmin()])
+        durations, durations_array = self._durations_by_temperature[selected_temperature]
+        default_value = durations[int(np.abs(durations_array - fermentation).argmin())]
 
-        setattr(self._recipe, temperature_tag, selected_temperature)
-        setattr(self._recipe, fermentation_tag, float(default_value))
+        with self._recipe.batched_updates():
+            setattr(self._recipe, temperature_tag, selected_temperature)
+            setattr(self._recipe, fermentation_tag, float(default_value))
         dpg.configure_item(fermentation_tag, items=durations, default_value=default_value)
 
-    def _update_proofing_mode(self, first_type, second_type, show_first, show_second):
-        """
-        Toggles visibility of proofing UI items and optionally resets their stored values.
-
-        Args:
-            first_type (ProofingType): ProofingType to show/hide first.
-            second_type (ProofingType): ProofingType to show/hide second.
-            show_first (bool): Whether to show the first proofing type.
-            show_second (bool): Whether to show the second proofing type.
-        """
-        self._proof_handler.toggle_proof_item(first_type, show_first)
-        self._proof_handler.toggle_proof_item(second_type, show_second)
-        self._proof_handler.store_proofing_values(first_type, reset=not show_first)
-        self._proof_handler.store_proofing_values(second_type, reset=not show_second)
-
     def proofing_mode_callback(self, proofing_mode: ProofingMode):
         """
         Called when the user selects a new proofing mode (dual/room-only/fridge-only).
@@ -156,15 +170,8 @@ class CallbackHandler:
         Args:
             proofing_mode (ProofingMode): A ProofingMode enum indicating the desired UI configuration.
         """
-        if proofing_mode == ProofingMode.dual_proofing_mode:
-            self._update_proofing_mode(ProofingType.room, ProofingType.fridge, True, True)
-        elif proofing_mode == ProofingMode.room_proofing_only_mode:
-            self._update_proofing_mode(ProofingType.room, ProofingType.fridge, True, False)
-        else:
-            self._update_proofing_mode(ProofingType.fridge, ProofingType.room, True, False)
-
-        if dpg.does_item_exist("output_text"):
-            self.update_output()
+        self._proof_handler.apply_proofing_visibility(_PROOFING_MODE_VISIBILITY[proofing_mode])
+        self.update_output()
 
     def proofing_mode_setup_callback(self):
         """Initializes the UI proofing state based on current recipe proofing configuration."""
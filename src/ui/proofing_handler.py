@@ -8,7 +8,7 @@ and syncing with the recipe model.
 
 import dearpygui.dearpygui as dpg
 
-from src.configuration import Configuration
+from src.configuration import get_configuration
 from .ui_enums import ProofingType, ProofingMode
 
 
@@ -26,7 +26,13 @@ class ProofingHandler:
             recipe (PizzaRecipe): The recipe object that stores fermentation and temperature values.
         """
         self._recipe = recipe
-        self._configuration = Configuration()
+        self._configuration = get_configuration()
+
+        # Last visibility written per row tag; rows are only shown or hidden through this handler.
+        self._shown = {}
+
+        # Set once the proofing mode radio button has been created; it lives for the rest of the session.
+        self._proofing_mode_exists = False
 
     def store_proofing_values(self, proofing_type: ProofingType, reset=False):
         """
@@ -36,18 +42,33 @@ class ProofingHandler:
             proofing_type (ProofingType): The type of proofing (room or fridge).
             reset (bool): If True, resets the values to 0. Otherwise, updates the values from the UI.
         """
-        temperature_tag = proofing_type.value["temperature"]
-        fermentation_tag = proofing_type.value["fermentation"]
+        temperature_tag = proofing_type.value.temperature
+        fermentation_tag = proofing_type.value.fermentation
 
         if reset:
             temperature = 0.0
             fermentation = 0.0
         else:
-            temperature = float(dpg.get_value(temperature_tag))
-            fermentation = float(dpg.get_value(fermentation_tag))
+            temperature, fermentation = map(float, dpg.get_values((temperature_tag, fermentation_tag)))
+
+        with self._recipe.batched_updates():  # Recalculate the yeast percentage once, with both values set.
+            setattr(self._recipe, fermentation_tag, fermentation)
+            setattr(self._recipe, temperature_tag, temperature)
+
+    def apply_proofing_visibility(self, visibility):
+        """
+        Shows or hides each proofing type and stores its values, recalculating the yeast percentage once.
+        Hidden proofing types are reset to 0.
+
+        Args:
+            visibility (tuple): Pairs of (ProofingType, show) to apply, in order.
+        """
+        for proofing_type, show in visibility:
+            self.toggle_proof_item(proofing_type, show)
 
-        setattr(self._recipe, f"_{fermentation_tag}", fermentation)  # Set directly to skip yeast recalculation
-        setattr(self._recipe, temperature_tag, temperature)
+        with self._recipe.batched_updates():
+            for proofing_type, show in visibility:
+                self.store_proofing_values(proofing_type, reset=not show)
 
     def update_proofing_mode_from_recipe(self):
         """
@@ -56,8 +77,10 @@ class ProofingHandler:
 
         This method will toggle the visibility of relevant proofing items in the UI.
         """
-        if not dpg.does_item_exist("proofing_mode"):
-            return
+        if not self._proofing_mode_exists:
+            if not dpg.does_item_exist("proofing_mode"):
+                return
+            self._proofing_mode_exists = True
 
         if self._recipe.room_fermentation > 0 and self._recipe.fridge_fermentation > 0:
             room_default_flag = True
@@ -81,19 +104,28 @@ class ProofingHandler:
 
         dpg.set_value("proofing_mode", mode.value)
 
-    @staticmethod
-    def toggle_proof_item(proofing_type: ProofingType, show=True):
+    def toggle_proof_item(self, proofing_type: ProofingType, show=True):
         """
         Toggles the visibility of proofing items (temperature and fermentation) in the UI.
+        Each item's label and input share a table row, so only the two rows are reconfigured.
 
         Args:
             proofing_type (ProofingType): The type of proofing (room or fridge).
             show (bool): Whether to show or hide the proofing items.
         """
-        temperature_tag = proofing_type.value["temperature"]
-        fermentation_tag = proofing_type.value["fermentation"]
+        self._configure_show(proofing_type.value.temperature_row, show)
+        self._configure_show(proofing_type.value.fermentation_row, show)
+
+    def _configure_show(self, tag, show):
+        """
+        Shows or hides a UI item, skipping the call when it already has the requested visibility.
+
+        Args:
+            tag (str): The tag of the item to configure.
+            show (bool): Whether the item should be visible.
+        """
+        if self._shown.get(tag) == show:
+            return
 
-        dpg.configure_item(temperature_tag, show=show)
-        dpg.configure_item(f"{temperature_tag}_label", show=show)
-        dpg.configure_item(fermentation_tag, show=show)
-        dpg.configure_item(f"{fermentation_tag}_label", show=show)
+        dpg.configure_item(tag, show=show)
+        self._shown[tag] = show
@@ -32,7 +32,7 @@ class Ui:
         if recipe is None:
             recipe = RecipeManager.load_recipe(use_default=True)
 
-        self._widget_handler = WidgetHandler(recipe)
+        self._widget_handler = WidgetHandler.get(recipe)
         self._widget_handler.create_viewport()
         self._widget_handler.create_menu_buttons()
         self._build_main_ui()
@@ -4,6 +4,7 @@ ui_enums.py
 Defines tag Enums for ingredients and proofing steps in the pizza recipe app.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -17,20 +18,35 @@ class IngredientType(Enum):
     ball_weight = "Ball Weight (g)"
 
 
+@dataclass(frozen=True)
+class ProofingTags:
+    """Labels and widget tags for one proofing step, with the derived row tags precomputed."""
+    temperature_label: str
+    fermentation_label: str
+    temperature: str
+    fermentation: str
+    temperature_row: str = field(init=False)
+    fermentation_row: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "temperature_row", f"{self.temperature}_row")
+        object.__setattr__(self, "fermentation_row", f"{self.fermentation}_row")
+
+
 class ProofingType(Enum):
     """Proofing types"""
-    room = {
-        "temperature_label": "Room Proof temperature (°C)",
-        "fermentation_label": "Room Proof Hours",
-        "temperature": "room_temperature",
-        "fermentation": "room_fermentation"
-    }
-    fridge = {
-        "temperature_label": "Cold Proof temperature (°C)",
-        "fermentation_label": "Cold Proof Hours",
-        "temperature": "fridge_temperature",
-        "fermentation": "fridge_fermentation"
-    }
+    room = ProofingTags(
+        temperature_label="Room Proof temperature (°C)",
+        fermentation_label="Room Proof Hours",
+        temperature="room_temperature",
+        fermentation="room_fermentation"
+    )
+    fridge = ProofingTags(
+        temperature_label="Cold Proof temperature (°C)",
+        fermentation_label="Cold Proof Hours",
+        temperature="fridge_temperature",
+        fermentation="fridge_fermentation"
+    )
 
 
 class ProofingMode(Enum):
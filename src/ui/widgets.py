@@ -6,38 +6,56 @@ Defines methods for loading input fields, proofing modes, and action buttons,
 as well as the layout and behavior of the main UI components.
 """
 
-from pathlib import Path
+import weakref
+
+from functools import cache
 
 import dearpygui.dearpygui as dpg
+import numpy as np
 
 from .callbacks import CallbackHandler
-from src.data import DataExtractor
-from src.configuration import Configuration
+from src.data import get_data_extractor
+from src.configuration import get_configuration
 from .ui_enums import IngredientType, ProofingType, ProofingMode, get_proofing_modes
 
+# Casts applied to ingredient widget values before they reach the recipe, keyed by ingredient tag.
+_INGREDIENT_CASTORS = {IngredientType.number_of_balls.name: int}
+
+# Choices offered by the number of balls combo box.
+_BALL_COUNT_ITEMS = tuple(str(count) for count in range(1, 11))
+
+# Proofing types in the order their temperature and fermentation rows appear in the proofing table.
+_PROOFING_TABLE_ORDER = (ProofingType.fridge, ProofingType.room)
+
 
 class WidgetHandler:
     """
     Manages UI widgets for a given PizzaRecipe instance.
-    Ensures only one handler exists per unique recipe object.
+    Use `WidgetHandler.get` to share one handler per unique recipe object.
     """
-    _instances = {}
+    _instances = weakref.WeakValueDictionary()  # Entries are dropped once their handler is no longer referenced.
+
+    __slots__ = (
+        "_recipe", "_data_extractor", "_configuration", "_callback_handler",
+        "_update_callback", "_fermentation_callback", "_temperature_callback",
+        "_temperature_range_rounded", "_get_sorted_durations_by_temperature", "_font_items", "__weakref__"
+    )
 
-    def __new__(cls, recipe):
+    @classmethod
+    def get(cls, recipe):
         """
-        Ensures a single instance per unique recipe object.
+        Returns the handler for a recipe, creating it on first request.
 
         Args:
             recipe: The pizza recipe object associated with this handler.
 
         Returns:
-            WidgetHandler: The singleton instance associated with the given recipe.
+            WidgetHandler: The single handler associated with the given recipe.
         """
-        if recipe not in cls._instances:
-            instance = super().__new__(cls)
-            cls._instances[recipe] = instance
-            instance._initialized = False
-        return cls._instances[recipe]
+        instance = cls._instances.get(recipe)
+        if instance is None:
+            instance = cls._instances[recipe] = cls(recipe)
+        return instance
 
     def __init__(self, recipe):
         """
@@ -46,57 +64,68 @@ class WidgetHandler:
         Args:
             recipe: The pizza recipe object that holds the recipe parameters.
         """
-        if self._initialized:
-            return
-
         self._recipe = recipe
-        self._data_extractor = DataExtractor()
-        self._configuration = Configuration()
+        self._data_extractor = get_data_extractor()
+        self._configuration = get_configuration()
         self._callback_handler = CallbackHandler(recipe)
 
-        self._yeast_types = self._data_extractor.get_yeast_types()
-
         self._update_callback = self._callback_handler.general_update
         self._fermentation_callback = self._callback_handler.fermentation_update
         self._temperature_callback = self._callback_handler.temperature_update
-        self._relative_path = Path(__file__).parent
 
         self._temperature_range_rounded = self._get_temperature_range_rounded()
         self._get_sorted_durations_by_temperature = self._data_extractor.get_sorted_durations_by_temperature
 
-        self._title_font, self._default_font, self._secondary_title_font = self._get_fonts()
+        self._font_items = None
+
+    @property
+    def _yeast_types(self):
+        """Yeast types offered by the yeast type combo box, read on first use."""
+        return self._data_extractor.get_yeast_types()
+
+    @property
+    def _title_font(self):
+        """Font for section titles; fonts are registered on first use."""
+        return self._get_fonts()[0]
+
+    @property
+    def _default_font(self):
+        """Default application font; fonts are registered on first use."""
+        return self._get_fonts()[1]
 
-        self._initialized = True
+    @property
+    def _secondary_title_font(self):
+        """Font for widget labels; fonts are registered on first use."""
+        return self._get_fonts()[2]
 
     def _get_fonts(self):
         """
-        Load and register fonts from configuration.
+        Load and register fonts from configuration on first call, then return them from the handler.
 
         Returns:
             tuple: (title_font, default_font, secondary_title_font)
         """
-        with dpg.font_registry():
-            title_info, default_info, secondary_info = self._configuration.get_fonts()
+        if self._font_items is None:
+            with dpg.font_registry():
+                self._font_items = tuple(dpg.add_font(path, size) for path, size in self._configuration.get_fonts())
+                dpg.bind_font(self._font_items[1])
 
-            title_font = dpg.add_font(title_info[0], title_info[1])
-            default_font = dpg.add_font(default_info[0], default_info[1])
-            secondary_font = dpg.add_font(secondary_info[0], secondary_info[1])
+        return self._font_items
 
-            dpg.bind_font(default_font)
-
-            return title_font, default_font, secondary_font
-
-    def _get_temperature_range_rounded(self):
+    @staticmethod
+    @cache
+    def _get_temperature_range_rounded():
         """
         Returns the temperature range, rounded to 1 decimal place, suitable for temperature-related widgets.
+        The range comes from the shared data extractor, so it is computed once and reused by every handler.
 
         Returns:
             list: A list of rounded temperature values.
         """
-        return [
-            str(int(t)) if float(t).is_integer() else str(round(t, 1))
-            for t in self._data_extractor.temperature_value_range
-        ]
+        temperatures = get_data_extractor().temperature_value_range
+        whole = temperatures.astype(np.int64)
+        rounded = np.where(temperatures == whole, whole.astype(str), np.round(temperatures, 1).astype(str))
+        return rounded.tolist()
 
     def load_input_widgets(self):
         """
@@ -120,17 +149,15 @@ class WidgetHandler:
             dpg.add_table_column()
             dpg.add_table_column()
 
-            self._load_cold_proof_temperature_widget()
-            self._load_cold_proof_fermentation_widget()
-            self._load_room_proof_temperature_widget()
-            self._load_room_proof_fermentation_widget()
+            for proofing_type in _PROOFING_TABLE_ORDER:
+                self._labeled_temperature_widget(proofing_type)
+                self._labeled_fermentation_widget(proofing_type)
 
         self._callback_handler.proofing_mode_setup_callback()
 
     def _load_number_of_balls_widget(self):
         """Loads the number of balls widget (dropdown)."""
-        items = [str(i) for i in range(1, 11)]
-        self._labeled_ingredient_widget(dpg.add_combo, IngredientType.number_of_balls, castor=int, items=items)
+        self._labeled_ingredient_widget(dpg.add_combo, IngredientType.number_of_balls, items=_BALL_COUNT_ITEMS)
 
     def _load_ball_weight_widget(self):
         """Loads the ball weight widget (integer input)."""
@@ -154,29 +181,13 @@ class WidgetHandler:
         ingredient_type = IngredientType.oil_percentage
         self._labeled_ingredient_widget(dpg.add_input_float, ingredient_type, max_value=5.0, format="%.1f")
 
-    def _load_cold_proof_temperature_widget(self):
-        """Loads the cold proof temperature widget (combo box)."""
-        self._labeled_temperature_widget(ProofingType.fridge)
-
-    def _load_cold_proof_fermentation_widget(self):
-        """Loads the cold proof fermentation widget (combo box)."""
-        self._labeled_fermentation_widget(ProofingType.fridge)
-
-    def _load_room_proof_temperature_widget(self):
-        """Loads the room proof temperature widget (combo box)."""
-        self._labeled_temperature_widget(ProofingType.room)
-
-    def _load_room_proof_fermentation_widget(self):
-        """Loads the room proof fermentation widget (combo box)."""
-        self._labeled_fermentation_widget(ProofingType.room)
-
     def load_proofing_modes_widget(self):
         """Loads the widget for selecting the proofing modes (room and cold proof)"""
-        dpg.add_text("Proofing Details", bullet=False, tag="proofing_title")
-        dpg.bind_item_font("proofing_title", self._title_font)
+        title = dpg.add_text("Proofing Details", bullet=False)
+        dpg.bind_item_font(title, self._title_font)
         dpg.add_radio_button(items=get_proofing_modes(),
                              default_value=ProofingMode.dual_proofing_mode.value,
-                             callback=lambda _, a: self._callback_handler.proofing_mode_callback(ProofingMode(a)),
+                             callback=self._proofing_mode_widget_callback,
                              horizontal=True,
                              tag="proofing_mode")
 
@@ -210,13 +221,13 @@ class WidgetHandler:
 
     def load_main_input_header(self):
         """ Loads the header for the main recipe inputs section """
-        dpg.add_text("Main Recipe Inputs", bullet=False, tag="main_title")
-        dpg.bind_item_font("main_title", self._title_font)
+        title = dpg.add_text("Main Recipe Inputs", bullet=False)
+        dpg.bind_item_font(title, self._title_font)
 
     def load_instructions_header(self):
         """ Loads the header for the ingredients and proofing instructions section """
-        dpg.add_text("Ingredients and Proofing Instructions", bullet=False, tag="instructions_title")
-        dpg.bind_item_font("instructions_title", self._title_font)
+        title = dpg.add_text("Ingredients and Proofing Instructions", bullet=False)
+        dpg.bind_item_font(title, self._title_font)
 
     def create_viewport(self):
         """ Creates and sets up the application viewport (window) """
@@ -245,22 +256,20 @@ class WidgetHandler:
             dpg.add_static_texture(width=width, height=height, default_value=load_icon_data, tag="load_icon")
             dpg.add_static_texture(width=width, height=height, default_value=export_icon_data, tag="export_icon")
 
-    def _labeled_ingredient_widget(self, widget_fn, ingredient_type: IngredientType, *, castor=None, **kwargs):
+    def _labeled_ingredient_widget(self, widget_fn, ingredient_type: IngredientType, **kwargs):
         """
         Create a labeled widget for an ingredient input field.
 
         Args:
             widget_fn: The DearPyGui widget function to call (e.g., dpg.add_input_float).
             ingredient_type: The ingredient type (IngredientType).
-            castor: Optional function to cast the input value before updating.
             kwargs: Additional keyword arguments passed to the widget.
         """
         label = ingredient_type.value
         tag = ingredient_type.name
         default_value = getattr(self._recipe, tag)
-        callback = (lambda _, a, u=tag: self._update_callback(a if castor is None else castor(a), u))
 
-        self._labeled_widget(label, widget_fn, tag, default_value=default_value, callback=callback, **kwargs)
+        self._labeled_widget(label, widget_fn, tag, default_value, self._ingredient_widget_callback, **kwargs)
 
     def _labeled_temperature_widget(self, proofing_type: ProofingType):
         """
@@ -269,13 +278,13 @@ class WidgetHandler:
         Args:
             proofing_type (ProofingType): The type of proofing (ProofingType).
         """
-        label = proofing_type.value["temperature_label"]
-        tag = proofing_type.value["temperature"]
+        label = proofing_type.value.temperature_label
+        tag = proofing_type.value.temperature
         items = self._temperature_range_rounded
         default_value = str(round(getattr(self._recipe, tag), 1))
-        callback = (lambda _, a: self._temperature_callback(a, proofing_type))
+        callback = self._temperature_widget_callback
 
-        self._labeled_widget(label, dpg.add_combo, tag, default_value, callback, items=items)
+        self._labeled_widget(label, dpg.add_combo, tag, default_value, callback, user_data=proofing_type, items=items)
 
     def _labeled_fermentation_widget(self, proofing_type: ProofingType):
         """
@@ -284,9 +293,9 @@ class WidgetHandler:
         Args:
             proofing_type (ProofingType): The type of proofing (ProofingType).
         """
-        fermentation_label = proofing_type.value["fermentation_label"]
-        fermentation_tag = proofing_type.value["fermentation"]
-        temperature_tag = proofing_type.value["temperature"]
+        fermentation_label = proofing_type.value.fermentation_label
+        fermentation_tag = proofing_type.value.fermentation
+        temperature_tag = proofing_type.value.temperature
 
         temperature = getattr(self._recipe, temperature_tag)
         fermentation = str(int(getattr(self._recipe, fermentation_tag)))
@@ -297,14 +306,15 @@ class WidgetHandler:
 
         items = self._get_sorted_durations_by_temperature(temperature)
         default_value = str(int(fermentation))
+        callback = self._fermentation_widget_callback
 
-        callback = (lambda _, a: self._fermentation_callback(a, proofing_type))
-
-        self._labeled_widget(fermentation_label, dpg.add_combo, fermentation_tag, default_value, callback, items=items)
+        self._labeled_widget(fermentation_label, dpg.add_combo, fermentation_tag, default_value, callback,
+                             user_data=proofing_type, items=items)
 
-    def _labeled_widget(self, label, widget_fn, tag, default_value, callback, **kwargs):
+    def _labeled_widget(self, label, widget_fn, tag, default_value, callback, user_data=None, **kwargs):
         """
         Create a labeled widget row with a text label and input widget.
+        The row is tagged "<tag>_row" so the label and input can be shown or hidden together.
 
         Args:
             label: The text to display next to the input.
@@ -312,12 +322,56 @@ class WidgetHandler:
             tag: Unique tag name for the widget.
             default_value: The default value shown in the widget.
             callback: Function to call when the value changes.
+            user_data: Value passed to the callback as user data. Defaults to the tag.
             kwargs: Additional arguments passed to the widget.
         """
-        with dpg.table_row():
-            dpg.add_text(label, tag=f"{tag}_label")
-            widget_fn(tag=tag, user_data=tag, default_value=default_value, callback=callback, width=-10, **kwargs)
-            dpg.bind_item_font(f"{tag}_label", self._secondary_title_font)
+        if user_data is None:
+            user_data = tag
+
+        with dpg.table_row(tag=f"{tag}_row"):
+            label_id = dpg.add_text(label)
+            widget_fn(tag=tag, user_data=user_data, default_value=default_value, callback=callback, width=-10, **kwargs)
+            dpg.bind_item_font(label_id, self._secondary_title_font)
+
+    def _ingredient_widget_callback(self, _sender, app_data, tag):
+        """
+        Dear PyGui callback for ingredient widgets; casts the value if needed and updates the recipe.
+
+        Args:
+            app_data: The new value from the widget.
+            tag (str): The ingredient tag, passed as the widget's user data.
+        """
+        castor = _INGREDIENT_CASTORS.get(tag)
+        self._update_callback(app_data if castor is None else castor(app_data), tag)
+
+    def _temperature_widget_callback(self, _sender, app_data, proofing_type):
+        """
+        Dear PyGui callback for proofing temperature combo boxes.
+
+        Args:
+            app_data: The selected temperature.
+            proofing_type (ProofingType): The proofing type, passed as the widget's user data.
+        """
+        self._temperature_callback(app_data, proofing_type)
+
+    def _fermentation_widget_callback(self, _sender, app_data, proofing_type):
+        """
+        Dear PyGui callback for proofing fermentation combo boxes.
+
+        Args:
+            app_data: The selected fermentation duration.
+            proofing_type (ProofingType): The proofing type, passed as the widget's user data.
+        """
+        self._fermentation_callback(app_data, proofing_type)
+
+    def _proofing_mode_widget_callback(self, _sender, app_data, _user_data):
+        """
+        Dear PyGui callback for the proofing mode radio button.
+
+        Args:
+            app_data (str): The label of the selected proofing mode.
+        """
+        self._callback_handler.proofing_mode_callback(ProofingMode(app_data))
 
     @staticmethod
     def _add_button(label, height, width, callback):